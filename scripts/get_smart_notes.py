@@ -19,9 +19,13 @@ Output:
 """
 
 import argparse
+import email.utils
 import functools
 import json
 import logging
+import os
+import random
+import re
 import sys
 import time
 from datetime import datetime, timedelta, timezone
@@ -29,15 +33,19 @@ from pathlib import Path
 from typing import Callable, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from google.api_core import exceptions as google_exceptions
 from google.apps import meet_v2
 from google.auth import exceptions as auth_exceptions
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
-from meet_auth import get_credentials
+from meet_auth import get_credentials, refresh_credentials
+
+# Optional faster JSON encoder; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Configure logging to stderr
@@ -48,6 +56,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Handle unicode output on Windows consoles (other platforms already use UTF-8)
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
 
 # Default time window if --before not specified (4 hours)
 DEFAULT_TIME_WINDOW_HOURS = 4
@@ -55,6 +67,18 @@ DEFAULT_TIME_WINDOW_HOURS = 4
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BASE_DELAY_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0     # Upper bound on a single computed backoff delay
+TOTAL_DEADLINE_SECONDS = 60.0  # Stop retrying once this much time would have elapsed
+
+# Conference lookup cache (relative to repo root, alongside other private data)
+CONFERENCE_CACHE_PATH = Path(__file__).parent.parent / "data" / ".cache" / "conf_lookup.json"
+CONFERENCE_CACHE_TTL = timedelta(hours=24)
+
+# Refresh the access token up front if it expires within this margin
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Zero-padded ISO 8601 date-time prefix, e.g. "2024-01-15T14:00:00" or "2024-01-15 14:00:00"
+ISO_DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
 
 # Error code constants
 ERROR_INVALID_TIMESTAMP = "invalid_timestamp"
@@ -70,55 +94,121 @@ ERROR_NOTES_NOT_READY = "notes_not_ready"
 ERROR_DRIVE_ACCESS_DENIED = "drive_access_denied"
 ERROR_NOTES_FETCH_ERROR = "notes_fetch_error"
 
+# Error code and message for Smart Notes states that aren't FILE_GENERATED yet
+NOTES_STATE_ERRORS = {
+    "STARTED": (
+        ERROR_NOTES_IN_PROGRESS,
+        "Smart Notes are still being generated (state: STARTED). Meeting may still be in progress.",
+    ),
+    "ENDED": (
+        ERROR_NOTES_NOT_READY,
+        "Smart Notes are still processing (state: ENDED). Try again in a few minutes.",
+    ),
+}
+
+# Shared HTTP session so REST calls reuse pooled TCP/TLS connections.
+# Retries are handled by retry_with_backoff, so the adapter's own retries are off.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
 
 # Type variable for generic retry decorator
 T = TypeVar("T")
 
+# Transient errors retried by retry_with_backoff (rate limits are handled separately)
+RETRYABLE_EXCEPTIONS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+
+
+class RateLimited(Exception):
+    """HTTP 429 response, carrying the server's Retry-After hint in seconds (if any)."""
+
+    def __init__(self, message: str = "", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds or an HTTP-date.
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(base_delay: float, attempt: int) -> float:
+    """Exponential delay for the given attempt, capped and scaled by 0.5x-1.0x jitter."""
+    return min(base_delay * (2 ** attempt), MAX_BACKOFF_SECONDS) * random.uniform(0.5, 1.0)
+
 
 def retry_with_backoff(
     max_retries: int = MAX_RETRIES,
     base_delay: float = RETRY_BASE_DELAY_SECONDS,
-    retryable_exceptions: tuple = (
-        google_exceptions.ServiceUnavailable,
-        google_exceptions.DeadlineExceeded,
-        requests.exceptions.Timeout,
-        requests.exceptions.ConnectionError,
-    ),
+    retryable_exceptions: tuple = RETRYABLE_EXCEPTIONS,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
-    Decorator that adds retry logic with exponential backoff.
+    Decorator that adds retry logic with jittered exponential backoff.
 
-    Handles rate limiting (HTTP 429) and transient errors.
+    Handles rate limiting (HTTP 429) and transient errors. Each delay is scaled
+    by a random factor in [0.5, 1.0) so concurrent runs don't retry in lockstep.
+    A server-supplied Retry-After (via RateLimited) is honored as a minimum delay.
+    Computed delays are capped at MAX_BACKOFF_SECONDS, and retries stop early if
+    the next sleep would run past TOTAL_DEADLINE_SECONDS since the first attempt.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
+            start = time.monotonic()
             last_exception = None
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
+                except RateLimited as e:
+                    # Rate limiting (HTTP 429) with optional Retry-After hint
+                    last_exception = e
+                    delay = max(e.retry_after or 0.0, _backoff_delay(base_delay, attempt))
+                    level, reason = logging.WARNING, "Rate limited (HTTP 429)"
                 except retryable_exceptions as e:
                     last_exception = e
-                    if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.info(f"Retry {attempt + 1}/{max_retries} for {func.__name__} after {delay}s: {e}")
-                        time.sleep(delay)
+                    delay = _backoff_delay(base_delay, attempt)
+                    level, reason = logging.INFO, "Transient error"
                 except google_exceptions.ResourceExhausted as e:
                     # Rate limiting (HTTP 429)
                     last_exception = e
-                    if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited, retry {attempt + 1}/{max_retries} after {delay}s")
-                        time.sleep(delay)
-                except HttpError as e:
-                    if e.resp.status == 429:
-                        last_exception = e
-                        if attempt < max_retries:
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Rate limited (HTTP 429), retry {attempt + 1}/{max_retries} after {delay}s")
-                            time.sleep(delay)
-                    else:
-                        raise
+                    delay = _backoff_delay(base_delay, attempt)
+                    level, reason = logging.WARNING, "Rate limited"
+
+                if attempt == max_retries:
+                    break
+                if time.monotonic() - start + delay > TOTAL_DEADLINE_SECONDS:
+                    logger.warning("Giving up on %s: retrying would exceed %ss deadline", func.__name__, TOTAL_DEADLINE_SECONDS)
+                    break
+                logger.log(
+                    level,
+                    "%s, retry %d/%d for %s after %.2fs: %s",
+                    reason, attempt + 1, max_retries, func.__name__, delay, last_exception,
+                )
+                time.sleep(delay)
             raise last_exception
         return wrapper
     return decorator
@@ -160,13 +250,26 @@ Note: Requires GCP project enrollment in Workspace Developer Preview Program.
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=128)
 def parse_timestamp(ts_str: str) -> datetime:
     """
     Parse ISO timestamp string to datetime.
 
     Handles both naive (assumes UTC) and timezone-aware timestamps.
+    Results are memoized; datetimes are immutable so sharing them is safe.
     """
-    # Try parsing with timezone
+    # Fast path: zero-padded ISO date-time is fully handled by fromisoformat,
+    # so skip the strptime fallbacks (they can't succeed where it failed)
+    if ISO_DATETIME_PATTERN.match(ts_str):
+        try:
+            dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"Cannot parse timestamp: {ts_str}") from None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+
+    # Try parsing with timezone (e.g. date-only)
     try:
         dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
         if dt.tzinfo is None:
@@ -175,7 +278,7 @@ def parse_timestamp(ts_str: str) -> datetime:
     except ValueError:
         pass
 
-    # Try common formats
+    # Try common formats (strptime also accepts non-zero-padded fields)
     for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
         try:
             dt = datetime.strptime(ts_str, fmt)
@@ -186,6 +289,21 @@ def parse_timestamp(ts_str: str) -> datetime:
     raise ValueError(f"Cannot parse timestamp: {ts_str}")
 
 
+def _format_rfc3339(dt: datetime) -> str:
+    """Format a timezone-aware datetime as an RFC 3339 UTC timestamp for API filters."""
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _dump_json(obj: dict) -> str:
+    """Serialize for stdout: indented for a terminal, compact when piped."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if sys.stdout.isatty() else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
 def output_error(error_code: str, message: str, format_type: str = "json", **extra) -> None:
     """Output error response and exit."""
     if format_type == "json":
@@ -195,7 +313,7 @@ def output_error(error_code: str, message: str, format_type: str = "json", **ext
             "message": message,
             **extra,
         }
-        print(json.dumps(result, indent=2))
+        print(_dump_json(result))
     else:
         print(f"Error: {message}", file=sys.stderr)
     sys.exit(1)
@@ -203,11 +321,8 @@ def output_error(error_code: str, message: str, format_type: str = "json", **ext
 
 def output_success(data: dict, format_type: str) -> None:
     """Output successful response."""
-    # Handle unicode on Windows
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-
     if format_type == "json":
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(_dump_json(data))
     else:
         # Text format - just output the notes content
         notes = data.get("notes", "")
@@ -225,41 +340,137 @@ def find_conference_record(
     Find conference record matching meeting code and time window.
 
     Note: The filter syntax MUST have spaces around the = operator.
+
+    The time window is pushed into the API filter, and records are consumed
+    lazily: the API returns them newest-first, so paging stops as soon as a
+    record starts before 'after'.
     """
-    # Build filter for meeting code - SPACES around = are required!
-    filter_str = f'space.meeting_code = "{meeting_code}"'
+    # Build filter for meeting code and window - SPACES around operators are required!
+    filter_str = (
+        f'space.meeting_code = "{meeting_code}"'
+        f' AND start_time >= "{_format_rfc3339(after)}"'
+        f' AND start_time <= "{_format_rfc3339(before)}"'
+    )
 
+    # Compare on POSIX timestamps so the loop doesn't do tz-aware datetime math
+    after_ts = after.timestamp()
+    before_ts = before.timestamp()
+
+    # Track the record closest to the 'after' time without collecting a list
+    best_record = None
+    best_distance = None
     try:
         request = meet_v2.ListConferenceRecordsRequest(filter=filter_str)
-        records = list(client.list_conference_records(request=request))
+        for record in client.list_conference_records(request=request):
+            record_start = record.start_time
+            if not record_start:
+                continue
+            # Naive timestamps from the API are UTC
+            if record_start.tzinfo is None:
+                record_start = record_start.replace(tzinfo=timezone.utc)
+            record_ts = record_start.timestamp()
+
+            if record_ts < after_ts:
+                # Ordered by start time descending - nothing older can match
+                break
+            if record_ts <= before_ts:
+                distance = record_ts - after_ts
+                if best_distance is None or distance < best_distance:
+                    best_record, best_distance = record, distance
     except google_exceptions.NotFound:
         return None
     except google_exceptions.PermissionDenied as e:
         raise PermissionError(f"Permission denied accessing Meet API: {e}")
 
-    if not records:
-        return None
+    return best_record
 
-    # Filter by time window and find closest match
-    matching_records = []
-    for record in records:
-        if record.start_time:
-            record_start = record.start_time
-            # Ensure timezone-aware comparison
-            if record_start.tzinfo is None:
-                record_start = record_start.replace(tzinfo=timezone.utc)
 
-            if after <= record_start <= before:
-                matching_records.append(record)
+def _conference_cache_key(meeting_code: str, after: datetime, before: datetime) -> str:
+    """Build the cache key for a conference lookup."""
+    return f"{meeting_code}|{after.isoformat()}|{before.isoformat()}"
+
+
+def _read_conference_cache() -> dict:
+    """Read the conference lookup cache, treating a missing or corrupt file as empty."""
+    try:
+        data = json.loads(CONFERENCE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
 
-    if not matching_records:
+def load_cached_conference(
+    meeting_code: str,
+    after: datetime,
+    before: datetime,
+) -> meet_v2.ConferenceRecord | None:
+    """
+    Look up a previously found conference record for this meeting code and window.
+
+    Returns:
+        ConferenceRecord rebuilt from the cache, or None if absent or older than
+        CONFERENCE_CACHE_TTL.
+    """
+    entry = _read_conference_cache().get(_conference_cache_key(meeting_code, after, before))
+    if not entry:
         return None
 
-    # Return the record closest to the 'after' time
-    matching_records.sort(key=lambda r: abs((r.start_time - after).total_seconds()))
-    return matching_records[0]
+    try:
+        cached_at = datetime.fromisoformat(entry["cached_at"])
+        if datetime.now(timezone.utc) - cached_at > CONFERENCE_CACHE_TTL:
+            return None
+        return meet_v2.ConferenceRecord(
+            name=entry["name"],
+            start_time=datetime.fromisoformat(entry["start_time"]),
+            end_time=datetime.fromisoformat(entry["end_time"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_cached_conference(
+    meeting_code: str,
+    after: datetime,
+    before: datetime,
+    record: meet_v2.ConferenceRecord,
+) -> None:
+    """
+    Store a found conference record in the lookup cache.
+
+    Only ended conferences are cached, since an in-progress record's end time
+    is still unknown. Expired entries are pruned on write. The file is replaced
+    atomically so concurrent runs never read a partial write. Failures are
+    logged and otherwise ignored - the cache is purely an optimization.
+    """
+    if not record.start_time or not record.end_time:
+        return
+
+    now = datetime.now(timezone.utc)
+    entries = {}
+    for key, entry in _read_conference_cache().items():
+        try:
+            if now - datetime.fromisoformat(entry["cached_at"]) <= CONFERENCE_CACHE_TTL:
+                entries[key] = entry
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    entries[_conference_cache_key(meeting_code, after, before)] = {
+        "name": record.name,
+        "start_time": record.start_time.isoformat(),
+        "end_time": record.end_time.isoformat(),
+        "cached_at": now.isoformat(),
+    }
+
+    tmp_path = CONFERENCE_CACHE_PATH.with_name(f"{CONFERENCE_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        CONFERENCE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        os.replace(tmp_path, CONFERENCE_CACHE_PATH)
+    except OSError as e:
+        logger.warning("Could not write conference lookup cache: %s", e)
 
 
+@retry_with_backoff()
 def get_smart_notes_metadata(
     conference_record_id: str,
     credentials: Credentials,
@@ -268,14 +479,11 @@ def get_smart_notes_metadata(
     Get Smart Notes metadata from v2beta API.
 
     Uses direct REST call since Python library doesn't support smartNotes yet.
+    Expects credentials to already hold a fresh access token (see main()).
 
     Returns:
         Dict with smartNotes list, or error key if API unavailable.
     """
-    # Ensure token is fresh
-    if credentials.expired:
-        credentials.refresh(Request())
-
     url = f"https://meet.googleapis.com/v2beta/conferenceRecords/{conference_record_id}/smartNotes"
     headers = {
         "Authorization": f"Bearer {credentials.token}",
@@ -283,7 +491,7 @@ def get_smart_notes_metadata(
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, headers=headers, timeout=30)
     except requests.exceptions.Timeout:
         raise TimeoutError("Request to Smart Notes API timed out")
     except requests.exceptions.ConnectionError as e:
@@ -293,10 +501,8 @@ def get_smart_notes_metadata(
         return response.json()
 
     if response.status_code == 404:
-        error_data = response.json().get("error", {})
-        message = error_data.get("message", "")
-
-        if "Method not found" in message:
+        # Cheap substring check on the raw body - no need to decode the error JSON
+        if b"Method not found" in response.content:
             return {"error": "api_not_available"}
         # Conference found but no smart notes resource
         return {"smartNotes": []}
@@ -305,7 +511,7 @@ def get_smart_notes_metadata(
         return {"error": "permission_denied", "message": response.text}
 
     if response.status_code == 429:
-        raise google_exceptions.ResourceExhausted(response.text)
+        raise RateLimited(response.text, retry_after=_parse_retry_after(response.headers.get("Retry-After")))
 
     response.raise_for_status()
     return response.json()
@@ -316,6 +522,9 @@ def download_notes_document(doc_id: str, credentials: Credentials) -> str:
     """
     Download Smart Notes content from Google Drive.
 
+    Calls the Drive v3 export endpoint directly over the shared session; this
+    is the script's only Drive call, so the googleapiclient stack isn't needed.
+
     Args:
         doc_id: Google Doc ID from Smart Notes metadata
         credentials: OAuth credentials for Drive API
@@ -325,28 +534,43 @@ def download_notes_document(doc_id: str, credentials: Credentials) -> str:
 
     Raises:
         PermissionError: If access to the document is denied.
+        FileNotFoundError: If the document doesn't exist.
+        RateLimited: If Drive returns HTTP 429 (retried by the decorator).
     """
-    try:
-        service = build("drive", "v3", credentials=credentials)
+    url = f"https://www.googleapis.com/drive/v3/files/{doc_id}/export"
+    headers = {"Authorization": f"Bearer {credentials.token}"}
 
-        # Export Google Doc as plain text
-        request = service.files().export(fileId=doc_id, mimeType="text/plain")
-        content = request.execute()
+    # Export Google Doc as plain text
+    response = _SESSION.get(url, headers=headers, params={"mimeType": "text/plain"}, timeout=30)
 
-        # Handle bytes vs string response
-        if isinstance(content, bytes):
-            return content.decode("utf-8")
-        return content
+    if response.status_code == 429:
+        raise RateLimited(response.text, retry_after=_parse_retry_after(response.headers.get("Retry-After")))
+    if response.status_code == 403:
+        raise PermissionError(
+            f"Access denied to Smart Notes document. "
+            f"Ensure you have read access to the Google Doc."
+        )
+    if response.status_code == 404:
+        raise FileNotFoundError(f"Smart Notes document not found: {doc_id}")
+
+    response.raise_for_status()
+    return response.content.decode("utf-8")
 
-    except HttpError as e:
-        if e.resp.status == 403:
-            raise PermissionError(
-                f"Access denied to Smart Notes document. "
-                f"Ensure you have read access to the Google Doc."
-            )
-        elif e.resp.status == 404:
-            raise FileNotFoundError(f"Smart Notes document not found: {doc_id}")
-        raise
+
+def _ensure_fresh_token(credentials: Credentials) -> None:
+    """
+    Refresh the access token once, before any API calls are made.
+
+    Refreshes if the token is invalid or expires within TOKEN_REFRESH_MARGIN.
+    The direct REST calls send the bearer token as-is and never refresh it
+    themselves, so it must stay valid for the whole run. The refreshed token is
+    saved, so the next run in the margin window doesn't refresh again.
+    """
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    near_expiry = credentials.expiry is not None and credentials.expiry - now < TOKEN_REFRESH_MARGIN
+    if not credentials.valid or near_expiry:
+        refresh_credentials(credentials)
 
 
 def main() -> None:
@@ -372,6 +596,7 @@ def main() -> None:
     # Authenticate
     try:
         creds = get_credentials()
+        _ensure_fresh_token(creds)
     except FileNotFoundError as e:
         output_error(ERROR_AUTH_CONFIG_MISSING, str(e), args.format)
         return
@@ -382,19 +607,31 @@ def main() -> None:
             args.format,
         )
         return
+    except auth_exceptions.TransportError as e:
+        output_error(
+            ERROR_AUTH_REFRESH_FAILED,
+            f"Token refresh failed: could not reach the token endpoint: {e}",
+            args.format,
+        )
+        return
 
-    # Create Meet API client
-    client = meet_v2.ConferenceRecordsServiceClient(credentials=creds)
+    # Find conference record, reusing a previous lookup for the same window if cached
+    record = load_cached_conference(args.meeting_code, after, before)
+    if record is None:
+        # Create Meet API client
+        client = meet_v2.ConferenceRecordsServiceClient(credentials=creds)
 
-    # Find conference record
-    try:
-        record = find_conference_record(client, args.meeting_code, after, before)
-    except PermissionError as e:
-        output_error(ERROR_MEET_ACCESS_DENIED, str(e), args.format)
-        return
-    except Exception as e:
-        output_error(ERROR_MEET_API_ERROR, f"Meet API error: {e}", args.format)
-        return
+        try:
+            record = find_conference_record(client, args.meeting_code, after, before)
+        except PermissionError as e:
+            output_error(ERROR_MEET_ACCESS_DENIED, str(e), args.format)
+            return
+        except Exception as e:
+            output_error(ERROR_MEET_API_ERROR, f"Meet API error: {e}", args.format)
+            return
+
+        if record:
+            save_cached_conference(args.meeting_code, after, before, record)
 
     if not record:
         output_error(
@@ -457,30 +694,13 @@ def main() -> None:
     docs_dest = note.get("docsDestination")
 
     # Check state
-    if state == "STARTED":
-        output_error(
-            ERROR_NOTES_IN_PROGRESS,
-            "Smart Notes are still being generated (state: STARTED). Meeting may still be in progress.",
-            args.format,
-            conference_id=conference_id,
-            notes_state=state,
-        )
-        return
-
-    if state == "ENDED":
-        output_error(
-            ERROR_NOTES_NOT_READY,
-            "Smart Notes are still processing (state: ENDED). Try again in a few minutes.",
-            args.format,
-            conference_id=conference_id,
-            notes_state=state,
-        )
-        return
-
     if state != "FILE_GENERATED":
+        error_code, message = NOTES_STATE_ERRORS.get(
+            state, (ERROR_NOTES_NOT_READY, f"Smart Notes not ready (state: {state})")
+        )
         output_error(
-            ERROR_NOTES_NOT_READY,
-            f"Smart Notes not ready (state: {state})",
+            error_code,
+            message,
             args.format,
             conference_id=conference_id,
             notes_state=state,
@@ -8,31 +8,50 @@ Given a meeting code and time window, retrieves the transcript text.
 Usage:
     python get_transcript.py --meeting-code "abc-defg-hij" --after "2024-01-15T14:00:00"
     python get_transcript.py --meeting-code "abc-defg-hij" --after "2024-01-15T14:00:00" --format text
+    python get_transcript.py --batch jobs.json
 
 Output:
-    JSON with {found, transcript, error} fields, or plain text if --format text
+    JSON with {found, transcript, error} fields, or plain text if --format text.
+    With --batch, one such JSON object per line, in job order.
 """
 
 import argparse
+import collections
+import contextlib
+import email.utils
 import functools
+import io
+import itertools
 import json
 import logging
+import os
+import random
 import re
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Callable, Iterable, Iterator, TypeVar
 
+import google_auth_httplib2
+import httplib2
 from google.api_core import exceptions as google_exceptions
 from google.apps import meet_v2
 from google.auth import exceptions as auth_exceptions
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 
 from meet_auth import get_credentials
 
+# Optional faster JSON encoder; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging to stderr
 logging.basicConfig(
@@ -42,6 +61,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson emits raw UTF-8 rather than \u escapes, so make sure Windows
+# consoles can print it (other platforms already use UTF-8)
+if orjson is not None and sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 # Default time window if --before not specified (4 hours)
 DEFAULT_TIME_WINDOW_HOURS = 4
@@ -49,6 +72,23 @@ DEFAULT_TIME_WINDOW_HOURS = 4
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BASE_DELAY_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# Client-side request budget, enforced over a sliding one-minute window
+REQUESTS_PER_MINUTE = 60
+
+# AIMD concurrency control for batched runs
+MAX_CONCURRENCY = 8
+TARGET_JOB_LATENCY_SECONDS = 10.0
+
+# Socket timeout for Drive API requests
+DRIVE_HTTP_TIMEOUT_SECONDS = 30
+
+# Drive export download chunk size (1 MiB)
+DOWNLOAD_CHUNK_SIZE_BYTES = 1024 * 1024
+
+# Downloaded transcript docs, keyed by conference ID (relative to repo root, alongside other private data)
+TRANSCRIPT_CACHE_DIR = Path(__file__).parent.parent / "data" / ".cache" / "transcripts"
 
 # Error code constants
 ERROR_INVALID_TIMESTAMP = "invalid_timestamp"
@@ -64,26 +104,192 @@ ERROR_TRANSCRIPT_NOT_READY = "transcript_not_ready"
 ERROR_DRIVE_ACCESS_DENIED = "drive_access_denied"
 ERROR_TRANSCRIPT_EMPTY = "transcript_empty"
 ERROR_TRANSCRIPT_FETCH_ERROR = "transcript_fetch_error"
+ERROR_INVALID_BATCH = "invalid_batch_input"
+ERROR_UNEXPECTED = "unexpected_error"
+
+
+# Speaker label at the start of a line, followed by a colon. Matches:
+# - "Speaker N:" where N is a number
+# - "Name:" where Name is 1-3 words (handles "John", "John Smith", "John Q. Smith")
+# [^\S\n] (whitespace other than newline) keeps every match within a single line,
+# so one MULTILINE pass over the whole transcript behaves like a per-line pass.
+SPEAKER_LABEL_PATTERN = re.compile(
+    r"^(?:Speaker[^\S\n]+\d+|[A-Z][a-zA-Z]*(?:[^\S\n]+[A-Z]\.?)?(?:[^\S\n]+[A-Z][a-zA-Z]*)?):[^\S\n]*",
+    re.MULTILINE,
+)
+
+
+# Zero-padded ISO 8601 date-time prefix, e.g. "2024-01-15T14:00:00" or "2024-01-15 14:00:00"
+ISO_DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
+
+# Bound once so hot paths skip the module attribute lookup
+_UTC = timezone.utc
+
+# Python 3.11+ fromisoformat accepts a trailing "Z"; older versions need it
+# spelled as an explicit UTC offset
+if sys.version_info >= (3, 11):
+    _FROMISO = datetime.fromisoformat
+else:
+    def _FROMISO(ts_str: str) -> datetime:
+        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+
+
+# Monotonic timestamps of API requests made in the last minute
+_REQUEST_TIMES: collections.deque[float] = collections.deque()
+_REQUEST_TIMES_LOCK = threading.Lock()
+
+# Serializes use of the shared Drive client across batch worker threads
+_DRIVE_LOCK = threading.Lock()
 
 
 # Type variable for generic retry decorator
 T = TypeVar("T")
 
 
+class TranscriptError(Exception):
+    """Transcript fetch failure, carrying its error code and extra output fields."""
+
+    def __init__(self, error_code: str, message: str, **extra):
+        super().__init__(message)
+        self.error_code = error_code
+        self.message = message
+        self.extra = extra
+
+
+def _wait_if_throttled(rpm: int = REQUESTS_PER_MINUTE) -> None:
+    """
+    Block until another API request fits in the sliding one-minute window.
+
+    Proactive counterpart to retry_with_backoff: throttles before the provider
+    starts returning 429s. Called at the top of each API-calling function, so
+    every retry attempt counts against the budget too; list calls also charge
+    each further page via _paged_items, so the budget counts HTTP requests.
+    """
+    with _REQUEST_TIMES_LOCK:
+        now = time.monotonic()
+        while _REQUEST_TIMES and now - _REQUEST_TIMES[0] >= 60:
+            _REQUEST_TIMES.popleft()
+
+        if len(_REQUEST_TIMES) >= rpm:
+            wait_seconds = 60 - (now - _REQUEST_TIMES[0])
+            logger.info(f"Client-side rate limit of {rpm} requests/min reached, waiting {wait_seconds:.2f}s")
+            time.sleep(wait_seconds)
+            now = time.monotonic()
+            _REQUEST_TIMES.popleft()
+
+        _REQUEST_TIMES.append(now)
+
+
+def _paged_items(pager, field: str) -> Iterator:
+    """
+    Iterate the items of a Meet list pager, charging the request budget per page.
+
+    The first page was fetched (and charged) by the list call that returned the
+    pager; each later page costs another request, so it waits for the budget
+    before the pager fetches it. `field` names the repeated field holding the
+    items in each page response (e.g. "transcript_entries").
+    """
+    pages = iter(pager.pages)
+    page = next(pages)
+    while True:
+        yield from getattr(page, field)
+        if not page.next_page_token:
+            return
+        _wait_if_throttled()
+        page = next(pages)
+
+
+def _decorrelated_jitter(base_delay: float, prev_delay: float, cap: float) -> float:
+    """Next backoff delay using decorrelated jitter: uniform(base, 3 * previous), capped."""
+    return min(cap, random.uniform(base_delay, prev_delay * 3))
+
+
+def _rate_limit_delay(error: Exception, base_delay: float, prev_delay: float, cap: float) -> float | None:
+    """
+    Delay before retrying a rate-limited call.
+
+    Uses the server's advised delay plus up to 0.5s of jitter when one is given,
+    otherwise falls back to decorrelated jitter.
+
+    Returns:
+        Seconds to wait, or None if the server asked for more than `cap`.
+        Retrying sooner than advised would just earn another 429, and waiting
+        that long would stall a batch worker, so the caller should give up.
+    """
+    server_delay = _server_retry_delay(error)
+    if server_delay is not None:
+        if server_delay > cap:
+            return None
+        return server_delay + random.uniform(0, 0.5)
+    return _decorrelated_jitter(base_delay, prev_delay, cap)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds or an HTTP-date.
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=_UTC)
+    return max(0.0, (retry_at - datetime.now(_UTC)).total_seconds())
+
+
+def _server_retry_delay(error: Exception) -> float | None:
+    """
+    Extract the server-advised retry delay from a rate-limit error, if any.
+
+    Checks the Retry-After header on Drive HttpErrors, and the RetryInfo detail
+    or Retry-After header on google.api_core errors.
+    """
+    if isinstance(error, HttpError):
+        return _parse_retry_after(error.resp.get("retry-after"))
+
+    for detail in getattr(error, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            return retry_delay.seconds + retry_delay.nanos / 1e9
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        return _parse_retry_after(headers.get("Retry-After"))
+    return None
+
+
 def retry_with_backoff(
     max_retries: int = MAX_RETRIES,
     base_delay: float = RETRY_BASE_DELAY_SECONDS,
     retryable_exceptions: tuple = (google_exceptions.ServiceUnavailable, google_exceptions.DeadlineExceeded),
+    cap: float = MAX_BACKOFF_SECONDS,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
-    Decorator that adds retry logic with exponential backoff.
+    Decorator that adds retry logic with jittered exponential backoff.
 
-    Handles rate limiting (HTTP 429) and transient errors.
+    Handles rate limiting (HTTP 429) and transient errors. Delays use
+    decorrelated jitter so parallel invocations don't retry in lock-step.
+    Rate-limit retries honor a server-supplied Retry-After when present; if it
+    exceeds `cap`, the error is raised instead of retrying early.
 
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
-        base_delay: Initial delay in seconds, doubles each retry (default: 1.0)
+        base_delay: Minimum delay in seconds; each retry waits a random time
+            between base_delay and 3x the previous delay (default: 1.0)
         retryable_exceptions: Tuple of exception types to retry on
+        cap: Maximum delay in seconds for any single retry; a longer
+            server-advised delay ends the retries (default: 30.0)
 
     Returns:
         Decorated function with retry logic.
@@ -92,29 +298,38 @@ def retry_with_backoff(
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
+            delay = base_delay
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except retryable_exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.info(f"Retry {attempt + 1}/{max_retries} for {func.__name__} after {delay}s: {e}")
+                        delay = _decorrelated_jitter(base_delay, delay, cap)
+                        logger.info(f"Retry {attempt + 1}/{max_retries} for {func.__name__} after {delay:.2f}s: {e}")
                         time.sleep(delay)
                 except google_exceptions.ResourceExhausted as e:
                     # Rate limiting (HTTP 429)
                     last_exception = e
                     if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited, retry {attempt + 1}/{max_retries} after {delay}s")
+                        delay = _rate_limit_delay(e, base_delay, delay, cap)
+                        if delay is None:
+                            logger.warning(f"Rate limited, server asked to wait longer than {cap:.0f}s; giving up")
+                            raise
+                        logger.warning(f"Rate limited, retry {attempt + 1}/{max_retries} after {delay:.2f}s")
                         time.sleep(delay)
                 except HttpError as e:
                     if e.resp.status == 429:
                         # HTTP 429 from Google APIs
                         last_exception = e
                         if attempt < max_retries:
-                            delay = base_delay * (2 ** attempt)
-                            logger.warning(f"Rate limited (HTTP 429), retry {attempt + 1}/{max_retries} after {delay}s")
+                            delay = _rate_limit_delay(e, base_delay, delay, cap)
+                            if delay is None:
+                                logger.warning(
+                                    f"Rate limited (HTTP 429), server asked to wait longer than {cap:.0f}s; giving up"
+                                )
+                                raise
+                            logger.warning(f"Rate limited (HTTP 429), retry {attempt + 1}/{max_retries} after {delay:.2f}s")
                             time.sleep(delay)
                     else:
                         raise
@@ -123,6 +338,83 @@ def retry_with_backoff(
     return decorator
 
 
+def _is_rate_limit_error(error: BaseException | None) -> bool:
+    """Whether an exception is a Meet or Drive rate-limit (HTTP 429) error."""
+    if isinstance(error, HttpError):
+        return error.resp.status == 429
+    return isinstance(error, google_exceptions.ResourceExhausted)
+
+
+class ConcurrencyController:
+    """
+    AIMD (additive-increase, multiplicative-decrease) limit on concurrent jobs.
+
+    Wrap each unit of API work in slot(). When recent jobs finish within the
+    target latency, the limit grows by `increase`; when they run slow (which
+    includes time spent in retry backoff) or hit a rate limit, it is scaled by
+    `decrease`. This converges on the quota ceiling without manual tuning.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        target_latency: float = TARGET_JOB_LATENCY_SECONDS,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        window: int = 10,
+    ):
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = 1.0
+        self._in_flight = 0
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self._condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[Callable[[], None]]:
+        """
+        Block until the current limit allows another job, then run it.
+
+        Yields a callback the job calls when it hit a rate limit it recovered
+        from (e.g. a Drive 429 handled by falling back to another API), so the
+        limit still backs off even though the job finished normally.
+        """
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+        start = time.monotonic()
+        throttled = False
+
+        def mark_throttled() -> None:
+            nonlocal throttled
+            throttled = True
+
+        try:
+            yield mark_throttled
+        except Exception as e:
+            # Callers may wrap the API error, so check what it was raised from too
+            throttled = throttled or _is_rate_limit_error(e) or _is_rate_limit_error(e.__context__)
+            raise
+        finally:
+            self._record(time.monotonic() - start, throttled)
+
+    def _record(self, latency: float, throttled: bool) -> None:
+        """Adjust the limit from a finished job and wake any waiting jobs."""
+        with self._condition:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if throttled or mean_latency > self.target_latency:
+                self.limit = max(1.0, self.limit * self.decrease)
+            else:
+                self.limit = min(float(self.max_concurrency), self.limit + self.increase)
+            self._condition.notify_all()
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -133,16 +425,15 @@ Examples:
   python get_transcript.py --meeting-code "abc-defg-hij" --after "2024-01-15T14:00:00"
   python get_transcript.py --meeting-code "abc-defg-hij" --after "2024-01-15T14:00:00" --format text
   python get_transcript.py --meeting-code "abc-defg-hij" --after "2024-01-15T14:00:00" --before "2024-01-15T16:00:00"
+  python get_transcript.py --batch jobs.json
         """,
     )
     parser.add_argument(
         "--meeting-code",
-        required=True,
         help="Google Meet code (e.g., abc-defg-hij from the meeting URL)",
     )
     parser.add_argument(
         "--after",
-        required=True,
         help="ISO timestamp - find conference starting after this time (e.g., 2024-01-15T14:00:00)",
     )
     parser.add_argument(
@@ -160,36 +451,97 @@ Examples:
         action="store_true",
         help="Include speaker labels in text output (only affects --format text)",
     )
-    return parser.parse_args()
-
-
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Never indent JSON output (by default it is indented only on a terminal)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="JOBS_JSON",
+        help="JSON file (or - for stdin) listing {meeting_code, after, before} jobs; "
+        "prints one JSON result per line (use instead of the single-meeting options)",
+    )
+    args = parser.parse_args()
+    if args.batch:
+        conflicting = [
+            flag for flag, is_set in (
+                ("--meeting-code", args.meeting_code is not None),
+                ("--after", args.after is not None),
+                ("--before", args.before is not None),
+                ("--format text", args.format != "json"),
+                ("--include-speakers", args.include_speakers),
+            ) if is_set
+        ]
+        if conflicting:
+            parser.error(f"--batch always emits JSON Lines and can't be combined with {', '.join(conflicting)}")
+    elif not (args.meeting_code and args.after):
+        parser.error("--meeting-code and --after are required unless --batch is given")
+    return args
+
+
+@functools.lru_cache(maxsize=64)
 def parse_timestamp(ts_str: str) -> datetime:
     """
     Parse ISO timestamp string to datetime.
 
     Handles both naive (assumes UTC) and timezone-aware timestamps.
+    Results are memoized; datetimes are immutable so sharing them is safe.
     """
-    # Try parsing with timezone
+    # Fast path: zero-padded ISO date-time is fully handled by fromisoformat,
+    # so skip the strptime fallbacks (they can't succeed where it failed)
+    if ISO_DATETIME_PATTERN.match(ts_str):
+        try:
+            dt = _FROMISO(ts_str)
+        except ValueError:
+            raise ValueError(f"Cannot parse timestamp: {ts_str}") from None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=_UTC)
+        return dt
+
+    # Try parsing with timezone (e.g. date-only)
     try:
-        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        dt = _FROMISO(ts_str)
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+            dt = dt.replace(tzinfo=_UTC)
         return dt
     except ValueError:
         pass
 
-    # Try common formats
+    # Try common formats (strptime also accepts non-zero-padded fields)
     for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
         try:
             dt = datetime.strptime(ts_str, fmt)
-            return dt.replace(tzinfo=timezone.utc)
+            return dt.replace(tzinfo=_UTC)
         except ValueError:
             continue
 
     raise ValueError(f"Cannot parse timestamp: {ts_str}")
 
 
-def output_error(error_code: str, message: str, format_type: str = "json", **extra) -> None:
+def _format_rfc3339(dt: datetime) -> str:
+    """Format a timezone-aware datetime as an RFC 3339 UTC timestamp for API filters."""
+    return dt.astimezone(_UTC).isoformat().replace("+00:00", "Z")
+
+
+def _dumps(obj: dict, indent: bool = True) -> str:
+    """Serialize for stdout, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _indent_output(compact: bool) -> bool:
+    """Indent JSON only for a human at a terminal; pipes get compact output."""
+    return not compact and sys.stdout.isatty()
+
+
+def output_error(
+    error_code: str, message: str, format_type: str = "json", compact: bool = False, **extra
+) -> None:
     """Output error response and exit."""
     if format_type == "json":
         result = {
@@ -198,16 +550,18 @@ def output_error(error_code: str, message: str, format_type: str = "json", **ext
             "message": message,
             **extra,
         }
-        print(json.dumps(result, indent=2))
+        print(_dumps(result, indent=_indent_output(compact)))
     else:
         print(f"Error: {message}", file=sys.stderr)
     sys.exit(1)
 
 
-def output_success(data: dict, format_type: str, include_speakers: bool) -> None:
+def output_success(
+    data: dict, format_type: str, include_speakers: bool, compact: bool = False
+) -> None:
     """Output successful response."""
     if format_type == "json":
-        print(json.dumps(data, indent=2))
+        print(_dumps(data, indent=_indent_output(compact)))
     else:
         # Text format - just output the transcript
         transcript = data.get("transcript", "")
@@ -231,20 +585,15 @@ def strip_speaker_labels(transcript: str) -> str:
     Returns:
         Transcript text with speaker labels removed.
     """
-    lines = []
-    # Pattern matches:
-    # - "Speaker N:" where N is a number
-    # - "Name:" where Name is 1-3 words (handles "John", "John Smith", "John Q. Smith")
-    # The pattern looks for speaker label at start of line followed by colon and space
-    speaker_pattern = re.compile(
-        r"^(?:Speaker\s+\d+|[A-Z][a-zA-Z]*(?:\s+[A-Z]\.?)?(?:\s+[A-Z][a-zA-Z]*)?):\s*",
-        re.MULTILINE,
-    )
-    for line in transcript.split("\n"):
-        # Remove speaker prefix if present
-        stripped_line = speaker_pattern.sub("", line)
-        lines.append(stripped_line)
-    return "\n".join(lines)
+    return SPEAKER_LABEL_PATTERN.sub("", transcript)
+
+
+def _distance_from(after: datetime, record: meet_v2.ConferenceRecord) -> float:
+    """Seconds between a conference record's start time and 'after'."""
+    record_start = record.start_time
+    if record_start.tzinfo is None:
+        record_start = record_start.replace(tzinfo=_UTC)
+    return abs((record_start - after).total_seconds())
 
 
 @retry_with_backoff()
@@ -267,39 +616,47 @@ def find_conference_record(
         ConferenceRecord if found, None otherwise.
         If multiple matches, returns the one closest to 'after' time.
     """
-    # Build filter for meeting code
+    _wait_if_throttled()
+
+    # Build filter for meeting code and time window
     # The API filter syntax uses the meeting_code from the space
-    filter_str = f'space.meeting_code="{meeting_code}"'
+    filter_str = (
+        f'space.meeting_code="{meeting_code}"'
+        f' AND start_time>="{_format_rfc3339(after)}"'
+        f' AND start_time<="{_format_rfc3339(before)}"'
+    )
 
+    # Consume pages lazily; records come back ordered by start time, newest first
+    matching_records = []
     try:
         request = meet_v2.ListConferenceRecordsRequest(filter=filter_str)
-        records = list(client.list_conference_records(request=request))
-    except google_exceptions.NotFound:
-        return None
-    except google_exceptions.PermissionDenied as e:
-        raise PermissionError(f"Permission denied accessing Meet API: {e}")
-
-    if not records:
-        return None
-
-    # Filter by time window and find closest match
-    matching_records = []
-    for record in records:
-        if record.start_time:
+        pager = client.list_conference_records(request=request)
+        for record in _paged_items(pager, "conference_records"):
+            if not record.start_time:
+                continue
             record_start = record.start_time
             # Ensure timezone-aware comparison
             if record_start.tzinfo is None:
-                record_start = record_start.replace(tzinfo=timezone.utc)
+                record_start = record_start.replace(tzinfo=_UTC)
 
-            if after <= record_start <= before:
+            if record_start < after:
+                # Nothing older can fall inside the window - skip remaining pages
+                break
+            if record_start <= before:
                 matching_records.append(record)
+    except google_exceptions.NotFound:
+        return None
+    except google_exceptions.PermissionDenied as e:
+        raise PermissionError(f"Permission denied accessing Meet API: {e}")
 
     if not matching_records:
         return None
 
+    if len(matching_records) == 1:
+        return matching_records[0]
+
     # Return the record closest to the 'after' time
-    matching_records.sort(key=lambda r: abs((r.start_time - after).total_seconds()))
-    return matching_records[0]
+    return min(matching_records, key=functools.partial(_distance_from, after))
 
 
 @retry_with_backoff()
@@ -317,9 +674,11 @@ def get_transcript_metadata(
     Returns:
         Transcript object if found, None if no transcript exists.
     """
+    _wait_if_throttled()
+
     try:
         request = meet_v2.ListTranscriptsRequest(parent=conference_record_name)
-        transcripts = list(client.list_transcripts(request=request))
+        transcripts = list(_paged_items(client.list_transcripts(request=request), "transcripts"))
     except google_exceptions.NotFound:
         return None
     except google_exceptions.PermissionDenied as e:
@@ -332,6 +691,23 @@ def get_transcript_metadata(
     return transcripts[0]
 
 
+@functools.lru_cache(maxsize=4)
+def _drive_service(credentials: Credentials):
+    """
+    Build a Drive v3 client, cached per credentials object.
+
+    The client owns a single authorized HTTP connection object, so every Drive
+    request made through it reuses the same keep-alive connection. It is built
+    from the discovery document bundled with googleapiclient, so no discovery
+    request (or on-disk discovery cache lookup) is made.
+    """
+    http = google_auth_httplib2.AuthorizedHttp(
+        credentials,
+        http=httplib2.Http(timeout=DRIVE_HTTP_TIMEOUT_SECONDS),
+    )
+    return build("drive", "v3", http=http, cache_discovery=False, static_discovery=True)
+
+
 @retry_with_backoff()
 def download_transcript_doc(doc_id: str, credentials: Credentials) -> str:
     """
@@ -347,17 +723,22 @@ def download_transcript_doc(doc_id: str, credentials: Credentials) -> str:
     Raises:
         PermissionError: If access to the document is denied.
     """
+    _wait_if_throttled()
+
     try:
-        service = build("drive", "v3", credentials=credentials)
+        service = _drive_service(credentials)
 
-        # Export Google Doc as plain text
-        request = service.files().export(fileId=doc_id, mimeType="text/plain")
-        content = request.execute()
+        # Export Google Doc as plain text, streamed in chunks into a single buffer.
+        # The shared httplib2 connection isn't thread-safe, so batch jobs take turns.
+        request = service.files().export_media(fileId=doc_id, mimeType="text/plain")
+        buffer = io.BytesIO()
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=DOWNLOAD_CHUNK_SIZE_BYTES)
+        with _DRIVE_LOCK:
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
 
-        # Handle bytes vs string response
-        if isinstance(content, bytes):
-            return content.decode("utf-8")
-        return content
+        return buffer.getvalue().decode("utf-8")
 
     except HttpError as e:
         if e.resp.status == 403:
@@ -370,161 +751,164 @@ def download_transcript_doc(doc_id: str, credentials: Credentials) -> str:
         raise
 
 
+def load_cached_transcript(conference_id: str) -> str | None:
+    """
+    Read a previously downloaded transcript doc for a conference.
+
+    Transcripts are immutable once FILE_GENERATED, so cached text never goes stale.
+
+    Read as bytes so line endings come back exactly as downloaded.
+
+    Returns:
+        Cached transcript text, or None if not cached (or the cache file is empty).
+    """
+    try:
+        data = (TRANSCRIPT_CACHE_DIR / f"{conference_id}.txt").read_bytes()
+    except OSError:
+        return None
+    if not data:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def save_cached_transcript(conference_id: str, transcript_text: str) -> None:
+    """
+    Cache a downloaded transcript doc for a conference.
+
+    Written via a temp file and atomic rename so concurrent runs never read a
+    partial file. Failures are logged and otherwise ignored.
+    """
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{conference_id}.txt"
+    # Unique per process and per thread: --batch jobs for the same conference
+    # may save concurrently from worker threads
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(transcript_text.encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write transcript cache: {e}")
+
+
 @retry_with_backoff()
 def get_transcript_entries(
     client: meet_v2.ConferenceRecordsServiceClient,
     transcript_name: str,
-) -> list[meet_v2.TranscriptEntry]:
+) -> Iterable[meet_v2.TranscriptEntry]:
     """
     Get raw transcript entries (fallback if doc not ready).
 
+    The first page is fetched here (so it is retried); later pages are fetched
+    lazily as the result is iterated, so entries are never all held at once.
+
     Args:
         client: Meet API conference records client
         transcript_name: Full resource name of the transcript
 
     Returns:
-        List of TranscriptEntry objects with speaker and text.
+        Iterable of TranscriptEntry objects with speaker and text.
     """
-    entries = []
-    page_token = None
-
-    while True:
-        request = meet_v2.ListTranscriptEntriesRequest(
-            parent=transcript_name,
-            page_token=page_token,
-        )
-        response = client.list_transcript_entries(request=request)
+    _wait_if_throttled()
 
-        entries.extend(response.transcript_entries)
+    request = meet_v2.ListTranscriptEntriesRequest(parent=transcript_name)
+    return _paged_items(client.list_transcript_entries(request=request), "transcript_entries")
 
-        page_token = response.next_page_token
-        if not page_token:
-            break
 
-    return entries
-
-
-def format_entries_as_text(entries: list[meet_v2.TranscriptEntry]) -> str:
+def format_entries_as_text(entries: Iterable[meet_v2.TranscriptEntry]) -> str:
     """
     Format transcript entries into readable text.
 
-    Groups consecutive entries by same speaker for readability.
+    Groups consecutive entries by same speaker for readability. Entries are
+    consumed lazily, one speaker run at a time.
 
     Args:
-        entries: List of TranscriptEntry objects
+        entries: Iterable of TranscriptEntry objects
 
     Returns:
         Formatted transcript string.
     """
-    if not entries:
-        return ""
-
-    lines = []
-    current_speaker = None
-    current_text = []
-
-    for entry in entries:
-        speaker = entry.participant or "Unknown"
-        text = entry.text or ""
-
-        if speaker != current_speaker:
-            # Flush previous speaker's text
-            if current_text:
-                lines.append(f"{current_speaker}: {' '.join(current_text)}")
-            current_speaker = speaker
-            current_text = [text]
-        else:
-            current_text.append(text)
-
-    # Flush final speaker
-    if current_text:
-        lines.append(f"{current_speaker}: {' '.join(current_text)}")
+    runs = itertools.groupby(entries, key=lambda entry: entry.participant or "Unknown")
+    return "\n\n".join(
+        f"{speaker}: {' '.join(entry.text or '' for entry in run)}" for speaker, run in runs
+    )
 
-    return "\n\n".join(lines)
 
+def _conference_id(record: meet_v2.ConferenceRecord) -> str:
+    """Extract the conference ID from a conference record's resource name."""
+    return record.name.split("/")[-1]
 
-def main() -> None:
-    """Main entry point."""
-    args = parse_args()
 
-    # Parse timestamps
-    try:
-        after = parse_timestamp(args.after)
-    except ValueError as e:
-        output_error(ERROR_INVALID_TIMESTAMP, f"Invalid --after timestamp: {e}", args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
-
-    if args.before:
-        try:
-            before = parse_timestamp(args.before)
-        except ValueError as e:
-            output_error(ERROR_INVALID_TIMESTAMP, f"Invalid --before timestamp: {e}", args.format)
-            return  # Defensive: output_error exits, but explicit return for clarity
-    else:
-        before = after + timedelta(hours=DEFAULT_TIME_WINDOW_HOURS)
+def process_one(
+    client: meet_v2.ConferenceRecordsServiceClient,
+    creds: Credentials,
+    meeting_code: str,
+    after: datetime,
+    before: datetime,
+    drive_future: Future | None = None,
+    on_rate_limited: Callable[[], None] | None = None,
+) -> dict:
+    """
+    Fetch the transcript for one meeting.
 
-    # Authenticate
-    try:
-        creds = get_credentials()
-    except FileNotFoundError as e:
-        output_error(ERROR_AUTH_CONFIG_MISSING, str(e), args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
-    except auth_exceptions.RefreshError as e:
-        output_error(
-            ERROR_AUTH_REFRESH_FAILED,
-            f"Token refresh failed. Delete meet-tokens.json and re-authenticate: {e}",
-            args.format,
-        )
-        return  # Defensive: output_error exits, but explicit return for clarity
+    Args:
+        client: Meet API conference records client (shared across jobs)
+        creds: OAuth credentials (shared across jobs)
+        meeting_code: The meeting code (e.g., "abc-defg-hij")
+        after: Find conferences starting after this time
+        before: Find conferences starting before this time
+        drive_future: Background Drive client build to wait for before downloading
+        on_rate_limited: Called if a rate limit is absorbed by a fallback rather
+            than raised (e.g. a Drive 429 before falling back to entries)
 
-    # Create Meet API client
-    client = meet_v2.ConferenceRecordsServiceClient(credentials=creds)
+    Returns:
+        Success response dict.
 
+    Raises:
+        TranscriptError: With the error code and extra fields to report.
+    """
     # Find conference record
     try:
-        record = find_conference_record(client, args.meeting_code, after, before)
+        record = find_conference_record(client, meeting_code, after, before)
     except PermissionError as e:
-        output_error(ERROR_MEET_ACCESS_DENIED, str(e), args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
+        raise TranscriptError(ERROR_MEET_ACCESS_DENIED, str(e))
     except Exception as e:
-        output_error(ERROR_MEET_API_ERROR, f"Meet API error: {e}", args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
+        raise TranscriptError(ERROR_MEET_API_ERROR, f"Meet API error: {e}")
 
     if not record:
-        output_error(
+        raise TranscriptError(
             ERROR_NO_CONFERENCE,
-            f"No conference found for meeting code '{args.meeting_code}' "
+            f"No conference found for meeting code '{meeting_code}' "
             f"between {after.isoformat()} and {before.isoformat()}",
-            args.format,
-            meeting_code=args.meeting_code,
+            meeting_code=meeting_code,
         )
-        return  # Defensive: output_error exits, but explicit return for clarity
+
+    conference_id = _conference_id(record)
 
     # Get transcript metadata
     try:
         transcript = get_transcript_metadata(client, record.name)
     except PermissionError as e:
-        output_error(ERROR_TRANSCRIPT_ACCESS_DENIED, str(e), args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
+        raise TranscriptError(ERROR_TRANSCRIPT_ACCESS_DENIED, str(e))
     except Exception as e:
-        output_error(ERROR_TRANSCRIPT_API_ERROR, f"Transcript API error: {e}", args.format)
-        return  # Defensive: output_error exits, but explicit return for clarity
+        raise TranscriptError(ERROR_TRANSCRIPT_API_ERROR, f"Transcript API error: {e}")
 
     if not transcript:
-        output_error(
+        raise TranscriptError(
             ERROR_NO_TRANSCRIPT,
             "Meeting found but transcription was not enabled",
-            args.format,
-            conference_id=record.name.split("/")[-1],
-            meeting_code=args.meeting_code,
+            conference_id=conference_id,
+            meeting_code=meeting_code,
         )
-        return  # Defensive: output_error exits, but explicit return for clarity
 
     # Check transcript state using proper enum comparison
     transcript_ready = transcript.state == meet_v2.Transcript.State.FILE_GENERATED
 
-    # Get state name for error messages
-    state_name = transcript.state.name if hasattr(transcript.state, "name") else str(transcript.state)
+    # Get state name for error messages; proto-plus returns a plain int for
+    # enum values it does not know (e.g. a state added by a newer API)
+    state_name = getattr(transcript.state, "name", str(transcript.state))
 
     if not transcript_ready:
         # Transcript still processing - differentiate message based on state
@@ -534,17 +918,16 @@ def main() -> None:
             message = f"Transcript is still processing (state: {state_name}). Try again in a few minutes."
         else:
             message = f"Transcript is still processing (state: {state_name}). Try again in a few minutes."
-        output_error(
+        raise TranscriptError(
             ERROR_TRANSCRIPT_NOT_READY,
             message,
-            args.format,
-            conference_id=record.name.split("/")[-1],
+            conference_id=conference_id,
             transcript_state=state_name,
         )
-        return  # Defensive: output_error exits, but explicit return for clarity
 
     # Get transcript content
     transcript_text = None
+    doc_id = None
     doc_url = None
 
     # Try downloading from Google Doc first (preferred, better formatting)
@@ -552,52 +935,60 @@ def main() -> None:
         doc_id = transcript.docs_destination.document
         doc_url = transcript.docs_destination.export_uri or f"https://docs.google.com/document/d/{doc_id}/edit"
 
+        # Transcript is FILE_GENERATED here, so a cached copy is final
+        transcript_text = load_cached_transcript(conference_id)
+
+    if transcript_text is None and doc_id:
+        # Let the background build finish so the download reuses the cached client
+        if drive_future is not None:
+            wait([drive_future])
         try:
             transcript_text = download_transcript_doc(doc_id, creds)
         except PermissionError as e:
-            output_error(
+            raise TranscriptError(
                 ERROR_DRIVE_ACCESS_DENIED,
                 str(e),
-                args.format,
-                conference_id=record.name.split("/")[-1],
+                conference_id=conference_id,
                 doc_url=doc_url,
             )
-            return  # Defensive: output_error exits, but explicit return for clarity
         except FileNotFoundError:
             # Doc not found, fall back to entries
             pass
         except Exception as e:
             # Log warning but try fallback
             logger.warning(f"Could not download transcript doc: {e}")
+            if on_rate_limited is not None and _is_rate_limit_error(e):
+                on_rate_limited()
+
+        if transcript_text:
+            save_cached_transcript(conference_id, transcript_text)
 
     # Fallback: get raw transcript entries
     if not transcript_text:
         try:
-            entries = get_transcript_entries(client, transcript.name)
-            if entries:
-                transcript_text = format_entries_as_text(entries)
-            else:
-                output_error(
-                    ERROR_TRANSCRIPT_EMPTY,
-                    "Transcript exists but contains no content",
-                    args.format,
-                    conference_id=record.name.split("/")[-1],
-                )
-                return  # Defensive: output_error exits, but explicit return for clarity
+            entries = iter(get_transcript_entries(client, transcript.name))
+            # Peek at the first entry to detect an empty transcript without draining the pager
+            first_entry = next(entries, None)
+            if first_entry is not None:
+                transcript_text = format_entries_as_text(itertools.chain([first_entry], entries))
         except Exception as e:
-            output_error(
+            raise TranscriptError(
                 ERROR_TRANSCRIPT_FETCH_ERROR,
                 f"Failed to fetch transcript content: {e}",
-                args.format,
-                conference_id=record.name.split("/")[-1],
+                conference_id=conference_id,
+            )
+        if first_entry is None:
+            raise TranscriptError(
+                ERROR_TRANSCRIPT_EMPTY,
+                "Transcript exists but contains no content",
+                conference_id=conference_id,
             )
-            return  # Defensive: output_error exits, but explicit return for clarity
 
     # Build success response
     result = {
         "found": True,
-        "meeting_code": args.meeting_code,
-        "conference_id": record.name.split("/")[-1],
+        "meeting_code": meeting_code,
+        "conference_id": conference_id,
         "start_time": record.start_time.isoformat() if record.start_time else None,
         "end_time": record.end_time.isoformat() if record.end_time else None,
         "transcript_state": state_name,
@@ -607,7 +998,166 @@ def main() -> None:
     if doc_url:
         result["doc_url"] = doc_url
 
-    output_success(result, args.format, args.include_speakers)
+    return result
+
+
+def load_batch_jobs(path: str) -> list[dict]:
+    """
+    Load batch jobs from a JSON file ("-" reads stdin).
+
+    Expects a list of {"meeting_code", "after", "before"?} objects.
+
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If the content isn't a list of job objects.
+    """
+    if path == "-":
+        jobs = json.load(sys.stdin)
+    else:
+        with open(path, encoding="utf-8") as f:
+            jobs = json.load(f)
+
+    if not isinstance(jobs, list):
+        raise ValueError("expected a JSON list of jobs")
+    for i, job in enumerate(jobs):
+        if not isinstance(job, dict):
+            raise ValueError(f"job {i} must be an object with 'meeting_code' and 'after'")
+        for key in ("meeting_code", "after"):
+            if not isinstance(job.get(key), str) or not job[key]:
+                raise ValueError(f"job {i}: '{key}' must be a non-empty string")
+        if job.get("before") is not None and not isinstance(job["before"], str):
+            raise ValueError(f"job {i}: 'before' must be a string if given")
+    return jobs
+
+
+def run_batch(
+    client: meet_v2.ConferenceRecordsServiceClient,
+    creds: Credentials,
+    jobs: list[dict],
+    drive_future: Future | None = None,
+) -> None:
+    """
+    Fetch transcripts for many meetings in one process, emitting JSON Lines.
+
+    The Meet client, Drive client and credentials are shared across jobs, and
+    jobs run concurrently under a ConcurrencyController. Results are printed in
+    input order as they complete. Exits 1 if any job failed.
+    """
+    controller = ConcurrencyController()
+
+    def run_job(job: dict) -> dict:
+        meeting_code = job["meeting_code"]
+        try:
+            try:
+                after = parse_timestamp(job["after"])
+                before = (
+                    parse_timestamp(job["before"]) if job.get("before")
+                    else after + timedelta(hours=DEFAULT_TIME_WINDOW_HOURS)
+                )
+            except (ValueError, OverflowError) as e:
+                # OverflowError: the default window runs past datetime.max
+                raise TranscriptError(ERROR_INVALID_TIMESTAMP, f"Invalid timestamp: {e}")
+
+            with controller.slot() as mark_throttled:
+                return process_one(client, creds, meeting_code, after, before, drive_future, mark_throttled)
+        except TranscriptError as e:
+            return {
+                "found": False,
+                "error": e.error_code,
+                "message": e.message,
+                "meeting_code": meeting_code,
+                **e.extra,
+            }
+        except Exception as e:
+            # Report it as this job's result so one bad job can't drop the others'
+            logger.exception(f"Unexpected error fetching transcript for {meeting_code}")
+            return {
+                "found": False,
+                "error": ERROR_UNEXPECTED,
+                "message": f"Unexpected error: {e}",
+                "meeting_code": meeting_code,
+            }
+
+    all_found = True
+    with ThreadPoolExecutor(max_workers=controller.max_concurrency) as executor:
+        for result in executor.map(run_job, jobs):
+            all_found = all_found and result["found"]
+            print(_dumps(result, indent=False), flush=True)
+
+    if not all_found:
+        sys.exit(1)
+
+
+def main() -> None:
+    """Main entry point."""
+    args = parse_args()
+
+    if args.batch:
+        try:
+            jobs = load_batch_jobs(args.batch)
+        except (OSError, ValueError) as e:
+            output_error(ERROR_INVALID_BATCH, f"Invalid --batch input: {e}", "json", args.compact)
+            return  # Defensive: output_error exits, but explicit return for clarity
+    else:
+        # Parse timestamps
+        try:
+            after = parse_timestamp(args.after)
+        except ValueError as e:
+            output_error(ERROR_INVALID_TIMESTAMP, f"Invalid --after timestamp: {e}", args.format, args.compact)
+            return  # Defensive: output_error exits, but explicit return for clarity
+
+        if args.before:
+            try:
+                before = parse_timestamp(args.before)
+            except ValueError as e:
+                output_error(
+                    ERROR_INVALID_TIMESTAMP, f"Invalid --before timestamp: {e}", args.format, args.compact
+                )
+                return  # Defensive: output_error exits, but explicit return for clarity
+        else:
+            try:
+                before = after + timedelta(hours=DEFAULT_TIME_WINDOW_HOURS)
+            except OverflowError as e:
+                output_error(
+                    ERROR_INVALID_TIMESTAMP, f"Invalid --after timestamp: {e}", args.format, args.compact
+                )
+                return  # Defensive: output_error exits, but explicit return for clarity
+
+    # Authenticate
+    try:
+        creds = get_credentials()
+    except FileNotFoundError as e:
+        output_error(ERROR_AUTH_CONFIG_MISSING, str(e), args.format, args.compact)
+        return  # Defensive: output_error exits, but explicit return for clarity
+    except auth_exceptions.RefreshError as e:
+        output_error(
+            ERROR_AUTH_REFRESH_FAILED,
+            f"Token refresh failed. Delete meet-tokens.json and re-authenticate: {e}",
+            args.format,
+            args.compact,
+        )
+        return  # Defensive: output_error exits, but explicit return for clarity
+
+    # Create Meet API client
+    client = meet_v2.ConferenceRecordsServiceClient(credentials=creds)
+
+    # Build the Drive client in the background while the Meet lookups run.
+    # A failed build isn't cached, so download_transcript_doc surfaces any error.
+    drive_executor = ThreadPoolExecutor(max_workers=1)
+    drive_future = drive_executor.submit(_drive_service, creds)
+    drive_executor.shutdown(wait=False)
+
+    if args.batch:
+        run_batch(client, creds, jobs, drive_future)
+        return
+
+    try:
+        result = process_one(client, creds, args.meeting_code, after, before, drive_future)
+    except TranscriptError as e:
+        output_error(e.error_code, e.message, args.format, args.compact, **e.extra)
+        return  # Defensive: output_error exits, but explicit return for clarity
+
+    output_success(result, args.format, args.include_speakers, args.compact)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,12 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+# Optional faster JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configure logging to stderr
 logging.basicConfig(
@@ -34,6 +40,9 @@ SCOPES = [
 DEFAULT_TOKEN_PATH = Path(__file__).parent.parent / "data" / ".credentials" / "meet-tokens.json"
 DEFAULT_CLIENT_SECRETS = Path(__file__).parent.parent / "gcp-oauth.keys.json"
 
+# In-process credentials cache, keyed by (token_path, client_secrets_path, scopes)
+_CREDS_CACHE: dict[tuple[Path, Path, tuple[str, ...]], Credentials] = {}
+
 
 def get_credentials(
     token_path: Path | None = None,
@@ -43,6 +52,9 @@ def get_credentials(
     """
     Load existing OAuth tokens or run browser-based OAuth flow.
 
+    Credentials are cached in-process, so repeated calls with the same
+    arguments reuse one Credentials object instead of re-reading the token file.
+
     Args:
         token_path: Path to store/load tokens. Defaults to data/.credentials/meet-tokens.json
         client_secrets_path: Path to OAuth client config. Defaults to gcp-oauth.keys.json
@@ -59,6 +71,20 @@ def get_credentials(
     client_secrets_path = client_secrets_path or DEFAULT_CLIENT_SECRETS
     scopes = scopes or SCOPES
 
+    cache_key = (token_path, client_secrets_path, tuple(scopes))
+    creds = _CREDS_CACHE.get(cache_key)
+    if creds is not None:
+        if creds.valid:
+            return creds
+        if creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+                _save_credentials(creds, token_path)
+                return creds
+            except Exception as e:
+                logger.warning(f"Cached token refresh failed, reloading credentials: {e}")
+        del _CREDS_CACHE[cache_key]
+
     # Validate client secrets exist
     if not client_secrets_path.exists():
         raise FileNotFoundError(
@@ -71,7 +97,7 @@ def get_credentials(
     # Load existing tokens if available
     if token_path.exists():
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), scopes)
+            creds = Credentials.from_authorized_user_info(_loads(token_path.read_bytes()), scopes)
         except (json.JSONDecodeError, ValueError) as e:
             logger.warning(f"Invalid token file, will re-authenticate: {e}")
             creds = None
@@ -89,9 +115,26 @@ def get_credentials(
         creds = _run_oauth_flow(client_secrets_path, scopes)
         _save_credentials(creds, token_path)
 
+    _CREDS_CACHE[cache_key] = creds
     return creds
 
 
+def refresh_credentials(creds: Credentials, token_path: Path | None = None) -> None:
+    """
+    Refresh the access token now and save it, e.g. ahead of its expiry.
+
+    Args:
+        creds: Credentials to refresh (typically from get_credentials).
+        token_path: Token file to update. Defaults to data/.credentials/meet-tokens.json
+
+    Raises:
+        google.auth.exceptions.RefreshError: If the refresh token was rejected.
+        google.auth.exceptions.TransportError: If the token endpoint can't be reached.
+    """
+    creds.refresh(Request())
+    _save_credentials(creds, token_path or DEFAULT_TOKEN_PATH)
+
+
 def _run_oauth_flow(client_secrets_path: Path, scopes: list[str]) -> Credentials:
     """
     Run browser-based OAuth flow to get new credentials.
@@ -113,12 +156,22 @@ def _run_oauth_flow(client_secrets_path: Path, scopes: list[str]) -> Credentials
     return creds
 
 
+def _loads(data: bytes) -> dict:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _save_credentials(creds: Credentials, token_path: Path) -> None:
     """
     Save credentials to JSON file for future use.
 
     Creates parent directories if they don't exist.
-    Sets restrictive file permissions (600) on Unix systems.
+    Skips the write if the file already holds identical content; otherwise
+    writes a per-process temp file and atomically replaces the token file,
+    so an interrupted or concurrent save can't leave it truncated.
+    Creates the file with restrictive permissions (600) on Unix systems.
     """
     # Ensure directory exists
     token_path.parent.mkdir(parents=True, exist_ok=True)
@@ -132,13 +185,38 @@ def _save_credentials(creds: Credentials, token_path: Path) -> None:
         "client_secret": creds.client_secret,
         "scopes": creds.scopes,
     }
-
-    with open(token_path, "w") as f:
-        json.dump(token_data, f, indent=2)
-
-    # Set restrictive permissions on Unix systems (owner read/write only)
-    if os.name != "nt":  # Not Windows
-        os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)  # 600
+    # Keep the expiry (naive UTC, google-auth's own format) so a reloaded token
+    # is known to be expired or near expiry instead of assumed valid
+    if creds.expiry is not None:
+        token_data["expiry"] = creds.expiry.isoformat() + "Z"
+
+    if orjson is not None:
+        new_content = orjson.dumps(token_data, option=orjson.OPT_INDENT_2)
+    else:
+        new_content = json.dumps(token_data, indent=2).encode("utf-8")
+
+    try:
+        if token_path.read_bytes() == new_content:
+            # Nothing to write, but still enforce owner-only access (600) on
+            # Unix in case the existing file was created with looser permissions
+            if os.name != "nt":  # Not Windows
+                os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)
+            return
+    except FileNotFoundError:
+        pass
+
+    # Per-process temp name so concurrent refreshes never replace each other's
+    # half-written file. Created owner read/write only (600) on Unix so the
+    # refresh token is never readable by others, even before the rename.
+    tmp_path = token_path.with_name(f"{token_path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(new_content)
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     logger.info(f"Credentials saved to {token_path}")
 